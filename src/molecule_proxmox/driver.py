@@ -18,6 +18,7 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import functools
 import os
 
 from molecule import logger
@@ -27,6 +28,11 @@ from molecule.api import Driver
 
 LOG = logger.get_logger(__name__)
 
+PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULES_DIR = os.path.join(PKG_DIR, "modules")
+TEMPLATE_DIR = os.path.join(PKG_DIR, "cookiecutter")
+RDP_LAUNCHER = os.path.join(PKG_DIR, "rdp_launcher.py")
+
 
 class Proxmox(Driver):
     """
@@ -51,6 +57,9 @@ class Proxmox(Driver):
     def __init__(self, config=None):
         super(Proxmox, self).__init__(config)
         self._name = "molecule-proxmox"
+        self._instance_config_cache = {}
+        self._login_tpl_cache = {}
+        self._last_config = None
         library_path = os.environ.get("ANSIBLE_LIBRARY", "")
         if library_path:
             library_path = self.modules_dir() + ":" + library_path
@@ -70,29 +79,36 @@ class Proxmox(Driver):
     def login_cmd_template(self):
         """Return login command template based on instance OS type."""
         instance_name = self._get_target_instance_name()
+        os_type = "linux"
 
         if instance_name:
             try:
-                instance_config = self._get_instance_config(instance_name)
+                instance_config = self._cached_config(instance_name)
                 os_type = instance_config.get("os_type", "linux").lower()
-
-                if os_type == "windows":
-                    LOG.info('Opening RDP connection to Windows instance')
-                    rdp_launcher = os.path.join(os.path.dirname(__file__), "rdp_launcher.py")
-                    return "python3 " + rdp_launcher + " {address} {user} {rdp_port} {password}"
-            except (StopIteration, IOError, KeyError):
+            except (IOError, KeyError):
                 # If cannot determine os - fall back to ssh
                 pass
 
-        connection_options = " ".join(self.ssh_connection_options)
-        LOG.debug('Using SSH login command template')
-        return (
-            "ssh {{address}} "
-            "-l {{user}} "
-            "-p {{port}} "
-            "-i {{identity_file}} "
-            "{}"
-        ).format(connection_options)
+        if os_type == "windows":
+            LOG.info('Opening RDP connection to Windows instance')
+        else:
+            LOG.debug('Using SSH login command template')
+
+        # The template only depends on the os type, so build it once.
+        template = self._login_tpl_cache.get(os_type)
+        if template is None:
+            if os_type == "windows":
+                template = "python3 " + RDP_LAUNCHER + " {address} {user} {rdp_port} {password}"
+            else:
+                template = (
+                    "ssh {{address}} "
+                    "-l {{user}} "
+                    "-p {{port}} "
+                    "-i {{identity_file}} "
+                    "{}"
+                ).format(self._ssh_common_args)
+            self._login_tpl_cache[os_type] = template
+        return template
 
     def _get_target_instance_name(self):
         """Extract the target instance name from molecule command args."""
@@ -117,9 +133,16 @@ class Proxmox(Driver):
     def default_ssh_connection_options(self):
         return self._get_ssh_connection_options()
 
+    @functools.cached_property
+    def _ssh_common_args(self):
+        return " ".join(self.ssh_connection_options)
+
     def login_options(self, instance_name):
         d = {"instance": instance_name}
-        instance_config = self._get_instance_config(instance_name)
+        instance_config = self._cached_config(instance_name)
+
+        # Copy so the defaults below do not leak into the cached config.
+        instance_config = dict(instance_config)
 
         # Ensure rdp_port exists for Windows instances (backward compatibility)
         if instance_config.get("os_type") == "windows" and "rdp_port" not in instance_config:
@@ -134,39 +157,62 @@ class Proxmox(Driver):
     def ansible_connection_options(self, instance_name):
         try:
             d = self._get_instance_config(instance_name)
-            os_type = d.get("os_type", "linux")
-
-            if os_type == "windows":
-                return {
-                    "ansible_user": d["user"],
-                    "ansible_host": d["address"],
-                    "ansible_port": d["port"],
-                    "ansible_password": d.get("password"),
-                    "connection": "winrm",
-                    "ansible_winrm_transport": d.get("winrm_transport", "ntlm"),
-                    "ansible_winrm_server_cert_validation": d.get("winrm_cert_validation", "ignore"),
-                }
-            else:
-                return {
-                    "ansible_user": d["user"],
-                    "ansible_host": d["address"],
-                    "ansible_port": d["port"],
-                    "ansible_private_key_file": d["identity_file"],
-                    "connection": "ssh",
-                    "ansible_ssh_common_args": " ".join(self.ssh_connection_options),  # noqa: E501
-                }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned, therefore the
             # instance_config is not on disk.
             return {}
 
+        os_type = d.get("os_type", "linux")
+        if os_type == "windows":
+            return {
+                "ansible_user": d["user"],
+                "ansible_host": d["address"],
+                "ansible_port": d["port"],
+                "ansible_password": d.get("password"),
+                "connection": "winrm",
+                "ansible_winrm_transport": d.get("winrm_transport", "ntlm"),
+                "ansible_winrm_server_cert_validation": d.get("winrm_cert_validation", "ignore"),
+            }
+        else:
+            return {
+                "ansible_user": d["user"],
+                "ansible_host": d["address"],
+                "ansible_port": d["port"],
+                "ansible_private_key_file": d["identity_file"],
+                "connection": "ssh",
+                "ansible_ssh_common_args": self._ssh_common_args,
+            }
+
+    def _cached_config(self, instance_name):
+        """Return the instance config for the login command. The entry is
+        shared between login_options and login_cmd_template, which are
+        called back to back for the same instance by 'molecule login'.
+        """
+        if self._last_config and self._last_config[0] == instance_name:
+            return self._last_config[1]
+        instance_config = self._get_instance_config(instance_name)
+        self._last_config = (instance_name, instance_config)
+        return instance_config
+
     def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(self._config.driver.instance_config)  # noqa: E501
-        return next(
-            item for item in instance_config_dict if item["instance"] == instance_name   # noqa: E501
-        )
+        return self._load_instance_config()[instance_name]
+
+    def _load_instance_config(self):
+        """Return the instance_config entries indexed by instance name,
+        reloading the file only when it has been modified since it was last
+        read.
+        """
+        path = self._config.driver.instance_config
+        key = (path, os.stat(path).st_mtime_ns)
+        if key not in self._instance_config_cache:
+            instance_config_dict = util.safe_load_file(path)
+            self._instance_config_cache.clear()
+            self._instance_config_cache[key] = {
+                item["instance"]: item for item in instance_config_dict
+            }
+        return self._instance_config_cache[key]
 
     def sanity_checks(self):
         pass
@@ -175,7 +221,7 @@ class Proxmox(Driver):
         """Return path to its own cookiecutterm templates. It is used by init
         command in order to figure out where to load the templates from.
         """
-        return os.path.join(os.path.dirname(__file__), "cookiecutter")
+        return TEMPLATE_DIR
 
     def modules_dir(self):
-        return os.path.join(os.path.dirname(__file__), "modules")
+        return MODULES_DIR
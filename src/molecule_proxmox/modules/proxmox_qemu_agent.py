@@ -50,24 +50,35 @@ addresses:
   sample: ['192.168.136.123']
 """
 
+import operator  # noqa: E402
 import time  # noqa: E402
 import syslog  # noqa: E402
+from ipaddress import IPv4Address  # noqa: E402
 
 from proxmoxer import ProxmoxAPI  # noqa: E402
 from proxmoxer.core import ResourceException  # noqa: E402
 from ansible.module_utils.basic import AnsibleModule  # noqa: E402
 
+# Polling backoff, in seconds.
+POLL_DELAY_MIN = 0.1
+POLL_DELAY_MAX = 2.0
+POLL_DELAY_FACTOR = 1.5
+
+# Interfaces ignored when looking for the vm IP address.
+LOOPBACK_NAMES = frozenset(['lo', 'loopback'])
+
 
 def get_vm(module, proxmox, vmid):
     """
     Look up a vm by id, and fail if not found.
     """
-    vm_list = [vm for vm in proxmox.cluster.resources.get(type='vm') if vm['vmid'] == int(vmid)]  # noqa: E501
-    if len(vm_list) == 0:
+    # vmids are unique within a cluster, so stop at the first match.
+    target = int(vmid)
+    vm_list = proxmox.cluster.resources.get(type='vm')
+    vm = next((vm for vm in vm_list if vm['vmid'] == target), None)
+    if vm is None:
         module.fail_json(vmid=vmid, msg='VM with vmid = %s not found' % vmid)
-    if len(vm_list) > 1:
-        module.fail_json(vmid=vmid, msg='Multiple VMs with vmid = %s found' % vmid)  # noqa: E501
-    return vm_list[0]
+    return vm
 
 
 def start_vm(module, proxmox, vm):
@@ -76,19 +87,25 @@ def start_vm(module, proxmox, vm):
     """
     vmid = vm['vmid']
     proxmox_node = proxmox.nodes(vm['node'])
-    timeout = module.params['timeout']
+    deadline = time.monotonic() + module.params['timeout']
+    delay = POLL_DELAY_MIN
 
     syslog.syslog('Starting vmid {0}'.format(vmid))
     taskid = proxmox_node.qemu(vm['vmid']).status.start.post()
-    while timeout:
+    while True:
         task = proxmox_node.tasks(taskid).status.get()
-        if task['status'] == 'stopped' and task['exitstatus'] == 'OK':
-            time.sleep(1)  # Delay for API
-            return
-        timeout = timeout - 1
-        if timeout == 0:
+        if task['status'] == 'stopped':
+            if task['exitstatus'] == 'OK':
+                time.sleep(1)  # Delay for API
+                return
+            # The task has finished with an error; no need to keep polling.
+            msg = 'Failed to start vmid {0}: {1}'.format(vmid, task['exitstatus'])  # noqa: E501
+            syslog.syslog(msg)
+            module.fail_json(msg=msg)
+        if time.monotonic() >= deadline:
             break
-        time.sleep(1)
+        time.sleep(delay)
+        delay = min(delay * POLL_DELAY_FACTOR, POLL_DELAY_MAX)
     lastlog = proxmox_node.tasks(taskid).log.get()[:1]
     msg = 'Timeout while starting vmid {0}: {1}'.format(vmid, lastlog)
     syslog.syslog(msg)
@@ -101,10 +118,11 @@ def query_vm(module, proxmox, vm):
     """
     vmid = vm['vmid']
     proxmox_node = proxmox.nodes(vm['node'])
-    timeout = module.params['timeout']
+    deadline = time.monotonic() + module.params['timeout']
+    delay = POLL_DELAY_MIN
 
     syslog.syslog('Waiting for vmid {0} IP address'.format(vmid))
-    while timeout:
+    while True:
         reply = None
         try:
             reply = proxmox_node.qemu(vmid).agent.get('network-get-interfaces')  # noqa: E501
@@ -121,16 +139,35 @@ def query_vm(module, proxmox, vm):
             addresses = i2a(module, reply['result'])
             if len(addresses) > 0:
                 return addresses   # Found at least one address.
-        timeout = timeout - 1
-        if timeout == 0:
+        if time.monotonic() >= deadline:
             break
-        time.sleep(1)
+        time.sleep(delay)
+        delay = min(delay * POLL_DELAY_FACTOR, POLL_DELAY_MAX)
 
     msg = 'Timeout while waiting for vmid {0} IP address'.format(vmid)
     syslog.syslog(msg)
     module.fail_json(msg=msg)
 
 
+def ip_priority(ip):
+    """
+    Prioritize private IP addresses.
+    Priority order:
+    0 - Class A private (10.0.0.0/8)
+    1 - Class C private (192.168.0.0/16)
+    2 - Class B private (172.16.0.0/12)
+    3 - Public IPs
+    """
+    n = int(ip)
+    if n & 0xFF000000 == 0x0A000000:
+        return 0
+    if n & 0xFFFF0000 == 0xC0A80000:
+        return 1
+    if n & 0xFFF00000 == 0xAC100000:
+        return 2
+    return 3
+
+
 def i2a(module, interfaces):
     """
     Extract the non-loopback IPv4 addresses from
@@ -166,13 +203,13 @@ def i2a(module, interfaces):
         ['192.168.136.176']
 
     """
+    debug = module.params.get('debug', False)
     addrs = []
-    module.warn("====== TEMPORARY MESSAGE ======")
     for interface in interfaces:
         interface_name = interface.get('name', '')
 
         # Skip obvious loopback interfaces by name
-        if interface_name.lower() in ['lo', 'loopback']:
+        if interface_name.lower() in LOOPBACK_NAMES:
             continue
 
         if 'ip-addresses' in interface:
@@ -181,34 +218,25 @@ def i2a(module, interfaces):
                 aip = ip_address.get('ip-address', '')
 
                 if aip and atype == 'ipv4':
+                    try:
+                        ip = IPv4Address(aip)
+                    except ValueError:
+                        if debug:
+                            syslog.syslog('Skipping invalid address {0} on {1}'.format(aip, interface_name))
+                        continue
+
                     # Filter loopback and APIPA addresses
-                    if aip.startswith('127.') or aip.startswith('169.254.'):
-                        syslog.syslog('Skipping loopback/APIPA address {0} on {1}'.format(aip, interface_name))
+                    if ip.is_loopback or ip.is_link_local:
+                        if debug:
+                            syslog.syslog('Skipping loopback/APIPA address {0} on {1}'.format(aip, interface_name))
                         continue
 
-                    syslog.syslog('Found IPv4 address {0} on interface {1}'.format(aip, interface_name))
-                    addrs.append(aip)
-
-    def priority(ip):
-        """
-        Prioritize private IP addresses.
-        Priority order:
-        0 - Class A private (10.0.0.0/8)
-        1 - Class C private (192.168.0.0/16)
-        2 - Class B private (172.16.0.0/12)
-        3 - Public IPs
-        """
-        if ip.startswith('10.'):
-            return 0
-        elif ip.startswith('192.168.'):
-            return 1
-        elif ip.startswith('172.'):
-            parts = ip.split('.')
-            if len(parts) >= 2 and 16 <= int(parts[1]) <= 31:
-                return 2
-        return 3
-
-    addrs.sort(key=priority)
+                    if debug:
+                        syslog.syslog('Found IPv4 address {0} on interface {1}'.format(aip, interface_name))
+                    addrs.append((ip_priority(ip), aip))
+
+    addrs.sort(key=operator.itemgetter(0))
+    addrs = [aip for _, aip in addrs]
 
     if addrs:
         syslog.syslog('Detected IP addresses (sorted by priority): {0}'.format(addrs))
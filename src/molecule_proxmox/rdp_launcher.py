@@ -11,13 +11,17 @@ Supports:
 import sys
 import os
 import platform
+import shutil
 import subprocess
 import tempfile
+import time
 
+# Temporary .rdp files are left for the RDP client to read and removed
+# by a later run once they are older than RDP_FILE_MAX_AGE seconds.
+RDP_FILE_PREFIX = 'molecule-proxmox-'
+RDP_FILE_MAX_AGE = 3600
 
-def create_rdp_file(address, user, port=3389, password=None):
-    """Create a temporary .rdp file with connection settings."""
-    rdp_content = f"""screen mode id:i:2
+RDP_TEMPLATE = """screen mode id:i:2
 use multimon:i:0
 desktopwidth:i:1920
 desktopheight:i:1080
@@ -40,7 +44,7 @@ disable menu anims:i:1
 disable themes:i:0
 disable cursor setting:i:0
 bitmapcachepersistenable:i:1
-full address:s:{address}:{port}
+full address:s:{full_address}
 audiomode:i:0
 redirectprinters:i:1
 redirectcomports:i:0
@@ -63,16 +67,36 @@ gatewaybrokeringtype:i:0
 use redirection server name:i:0
 rdgiskdcproxy:i:0
 kdcproxyname:s:
-username:s:{user}
+username:s:{username}
 """
-    fd, rdp_file = tempfile.mkstemp(suffix='.rdp', text=True)
+
+
+def remove_stale_rdp_files():
+    """Remove .rdp files left by previous runs."""
+    tmpdir = tempfile.gettempdir()
+    cutoff = time.time() - RDP_FILE_MAX_AGE
     try:
-        with os.fdopen(fd, 'w') as f:
-            f.write(rdp_content)
-    except:
-        os.close(fd)
-        raise
-    return rdp_file
+        names = os.listdir(tmpdir)
+    except OSError:
+        return
+    for name in names:
+        if not (name.startswith(RDP_FILE_PREFIX) and name.endswith('.rdp')):
+            continue
+        path = os.path.join(tmpdir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
+def create_rdp_file(address, user, port=3389, password=None):
+    """Create a temporary .rdp file with connection settings."""
+    remove_stale_rdp_files()
+    rdp_content = RDP_TEMPLATE.format(full_address=f"{address}:{port}", username=user)
+    with tempfile.NamedTemporaryFile(mode='w', prefix=RDP_FILE_PREFIX, suffix='.rdp', delete=False) as f:
+        f.write(rdp_content)
+    return f.name
 
 
 def launch_rdp_macos(address, user, port=3389, password=None):
@@ -85,7 +109,8 @@ def launch_rdp_macos(address, user, port=3389, password=None):
     try:
         result = subprocess.run(
             ['open', rdp_url],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
         if result.returncode == 0:
@@ -100,13 +125,13 @@ def launch_rdp_macos(address, user, port=3389, password=None):
         print(f"Created RDP file: {rdp_file}")
         result = subprocess.run(
             ['open', rdp_file],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
         if result.returncode == 0:
             print(f"Connection: {address}:{port}")
             print(f"Username: {user}")
-            subprocess.Popen(['sh', '-c', f'sleep 3600 && rm -f {rdp_file}'])
             return True
         else:
             os.unlink(rdp_file)
@@ -123,18 +148,18 @@ def launch_rdp_macos(address, user, port=3389, password=None):
 def launch_rdp_linux(address, user, port=3389, password=None):
     print(f"Opening RDP connection to {address}:{port} as {user}...")
 
+    # Commands are built only for clients found on the PATH.
     rdp_clients = [
-        ['xfreerdp', f'/v:{address}:{port}', f'/u:{user}', '/cert:ignore', '/dynamic-resolution', '+clipboard'] + ([f'/p:{password}'] if password else []),
-        ['remmina', '-c', f'rdp://{user}{":" + password if password else ""}@{address}:{port}'],
-        ['rdesktop', f'{address}:{port}', '-u', user] + (['-p', password] if password else []) + ['-g', '1920x1080'],
+        ('xfreerdp', lambda: ['xfreerdp', f'/v:{address}:{port}', f'/u:{user}', '/cert:ignore', '/dynamic-resolution', '+clipboard'] + ([f'/p:{password}'] if password else [])),
+        ('remmina', lambda: ['remmina', '-c', f'rdp://{user}{":" + password if password else ""}@{address}:{port}']),
+        ('rdesktop', lambda: ['rdesktop', f'{address}:{port}', '-u', user] + (['-p', password] if password else []) + ['-g', '1920x1080']),
     ]
 
-    for cmd in rdp_clients:
+    for client_name, build_cmd in rdp_clients:
         try:
-            client_name = cmd[0]
-            if subprocess.run(['which', client_name], capture_output=True).returncode == 0:
+            if shutil.which(client_name):
                 print(f"Using {client_name}...")
-                subprocess.Popen(cmd)
+                subprocess.Popen(build_cmd())
                 print("RDP client launched")
                 print(f"Connection: {address}:{port}")
                 print(f"Username: {user}")
@@ -156,8 +181,6 @@ def launch_rdp_windows(address, user, port=3389, password=None):
         print("Microsoft Remote Desktop Connection launched")
         print(f"Connection: {address}:{port}")
         print(f"Username: {user}")
-
-        subprocess.Popen(['timeout', '/t', '3600', '/nobreak', '&&', 'del', rdp_file], shell=True)
         return True
     except Exception as e:
         print(f"Error launching RDP: {e}")